@@ -1,4 +1,5 @@
 import sys
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -7,7 +8,7 @@ from loguru import logger
 from streamlit.runtime import exists
 from streamlit.web import cli as st_cli
 
-from babel.core import Babel
+from babel.core import Babel, Saved
 from babel.utils.logging_cfg import setup_logging
 from babel.utils.env_cfg import set_offline_env
 
@@ -15,22 +16,27 @@ setup_logging()
 set_offline_env()
 
 
-def display_results(predictions: list[dict[str, Any]]) -> None:
+def display_results(predictions: Sequence[dict[str, Any]]) -> None:
     """
     Display the classification results.
 
     Args:
-        predictions (list[dict[str, Any]]): List of prediction dictionaries.
+        predictions (Sequence[dict[str, Any]]): Sequence of prediction dictionaries.
     """
     st.subheader("Results")
     st.caption("The model's predictions are listed below, sorted by confidence.")
-    for pred in predictions:
-        col1, col2 = st.columns([1, 3])
-        with col1:
-            st.write(f"**{pred['label']}**")
-        with col2:
-            st.progress(pred["score"])
-            st.caption(f"Confidence: {pred['score']:.4f}")
+    # A single table is one frontend message instead of several widgets per row
+    st.dataframe(
+        predictions,
+        column_order=("label", "score"),
+        column_config={
+            "label": st.column_config.TextColumn("Dialect"),
+            "score": st.column_config.ProgressColumn(
+                "Confidence", min_value=0.0, max_value=1.0, format="%.4f"
+            ),
+        },
+        hide_index=True,
+    )
 
 
 @st.cache_resource
@@ -41,7 +47,43 @@ def get_babel() -> Babel:
     Returns:
         Babel: The Babel instance.
     """
-    return Babel()
+    babel = Babel()
+    babel.warm_up()
+    return babel
+
+
+def release_saved_upload() -> None:
+    """
+    Delete the file saved for this session's previous upload, if any.
+    """
+    saved = st.session_state.pop("saved_upload", None)
+    st.session_state.pop("saved_upload_id", None)
+    if saved is not None:
+        saved.close()
+
+
+def get_saved_upload(uploaded_file: Any) -> Saved:
+    """
+    Save the uploaded file to disk once and reuse it across reruns.
+
+    A new upload replaces the session's previous file, which is deleted.
+
+    Args:
+        uploaded_file (Any): The uploaded file object from Streamlit.
+
+    Returns:
+        Saved: The saved upload.
+    """
+    saved = st.session_state.get("saved_upload")
+    if (
+        saved is None
+        or st.session_state.get("saved_upload_id") != uploaded_file.file_id
+    ):
+        release_saved_upload()
+        saved = Babel.save_uploaded_file(uploaded_file)
+        st.session_state["saved_upload"] = saved
+        st.session_state["saved_upload_id"] = uploaded_file.file_id
+    return saved
 
 
 def main() -> None:
@@ -61,10 +103,11 @@ def main() -> None:
     st.caption("Supported formats: MP3, M4A, WAV, OGG, FLAC, MP4, MKV, AVI, MOV, WEBM")
 
     with st.spinner("Initializing models..."):
-        babel = get_babel()
-        # Access properties to trigger loading within the spinner context
-        if not hasattr(babel, "classifier") or not hasattr(babel, "whisper_model"):
-            logger.error("Failed to load models")
+        # get_babel loads the models, so failures surface here
+        try:
+            babel = get_babel()
+        except Exception as e:
+            logger.exception(f"Failed to load models: {e}")
             st.error("Failed to load models. Please try again.")
             st.stop()
         logger.info("Models initialized successfully")
@@ -84,7 +127,10 @@ def main() -> None:
         unsafe_allow_html=True,
     )
 
-    if uploaded_file is not None:
+    if uploaded_file is None:
+        # The upload was removed, so its scratch file is no longer needed
+        release_saved_upload()
+    else:
         logger.info(f"File uploaded: {uploaded_file.name}")
         st.audio(uploaded_file)
 
@@ -102,23 +148,14 @@ def main() -> None:
             logger.info(
                 f"Starting analysis for {uploaded_file.name} (start={start_time}, duration={duration})"
             )
-            tmp_file_path = babel.save_uploaded_file(uploaded_file)
-            sliced_file_path = None
-
             try:
                 with st.spinner("Slicing audio..."):
-                    sliced_file_path = babel.slice_audio(
-                        tmp_file_path, start_time, duration
-                    )
-                    if not sliced_file_path:
-                        logger.error("Audio slicing failed")
-                        st.error(
-                            "Failed to slice audio. Please check the input parameters."
-                        )
-                        st.stop()
+                    # The preprocessing workers read the upload from disk
+                    saved = get_saved_upload(uploaded_file)
+                    audio, mel = babel.load_segment(saved, start_time, duration)
 
                 with st.spinner("Detecting language..."):
-                    language = babel.detect_language(sliced_file_path)
+                    language = babel.detect_language(audio, mel)
                     if not language:
                         logger.error("Language detection failed")
                         st.error("Failed to detect language. Please try again.")
@@ -134,7 +171,7 @@ def main() -> None:
                     st.stop()
 
                 with st.spinner("Analyzing..."):
-                    predictions = babel.predict_dialect(sliced_file_path)
+                    predictions = babel.predict_dialect(audio)
                     display_results(predictions)
                     if not predictions:
                         logger.error("Dialect prediction returned no results")
@@ -147,13 +184,6 @@ def main() -> None:
             except Exception as e:
                 logger.exception(f"An unexpected error occurred: {e}")
                 st.error(f"An unexpected error occurred: {e}")
-            finally:
-                # Cleanup sliced file
-                if sliced_file_path:
-                    Path(sliced_file_path).unlink(missing_ok=True)
-                # Cleanup original temp file
-                if tmp_file_path:
-                    Path(tmp_file_path).unlink(missing_ok=True)
 
 
 # ---- Streamlit CLI wrapper ----------------------------------------------- #
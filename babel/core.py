@@ -1,36 +1,469 @@
-import subprocess
+import bisect
+import contextlib
+import functools
+import importlib.resources
+import importlib.util
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import sys
 import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, BinaryIO, Self
 
+import av
+import numpy as np
 import streamlit as st
-import torch
-import whisper  # type: ignore
 from loguru import logger
-from transformers import Pipeline, pipeline
-from whisper.tokenizer import LANGUAGES  # type: ignore
 
 from babel.utils.env_cfg import load_model_env
 
+# torch, whisper, transformers and faster-whisper take seconds to import, so
+# they are imported where needed: the app renders before any model is loaded.
+# Preprocessing workers import whisper (and with it torch) for the log-mel
+# front end, but never transformers or faster-whisper
+if TYPE_CHECKING:
+    import torch
+    from transformers import Pipeline
+
+SAMPLE_RATE = 16000
+# Upper bounds (in seconds) of the length buckets used to batch classifier inputs.
+# Longer inputs run one at a time, since padding a batch to their length is costly.
+DIALECT_BUCKETS = (10.0, 30.0)
+DIALECT_PRECISIONS = ("int8", "fp16", "fp32")
+WHISPER_BACKENDS = ("faster-whisper", "openai")
+DEVICES = ("cuda", "mps", "cpu")
+# Demuxers for audio formats known from the file extension. Opening these with
+# a forced format skips FFmpeg's format and stream probing. The MP3 and FLAC
+# demuxers accept other formats and only fail while decoding, so they still probe.
+PROBE_FORMATS = MappingProxyType(
+    {".wav": "wav", ".m4a": "mp4", ".ogg": "ogg", ".opus": "ogg"}
+)
+FAST_PROBE_OPTIONS = MappingProxyType({"probesize": "32", "analyzeduration": "0"})
+MAX_BATCH_SIZE = 8
+# The fast language check only looks at the start of the segment and accepts
+# Arabic above this probability; anything else goes to the main Whisper model
+LID_SECONDS = 3
+LID_SAMPLES = LID_SECONDS * SAMPLE_RATE
+LID_CONFIDENCE = 0.8
+
+
+def logmel_spectrogram(audio: np.ndarray, n_mels: int) -> np.ndarray:
+    """
+    Compute the Whisper log-mel spectrogram of the first 30 seconds of audio.
+
+    Both backends use openai-whisper's ``torch.stft`` front end, which is about
+    twice as fast on CPU as faster-whisper's numpy feature extractor.
+
+    Args:
+        audio (np.ndarray): Mono float32 waveform sampled at 16 kHz.
+        n_mels (int): The number of mel bins expected by the model.
+
+    Returns:
+        np.ndarray: A float32 log-mel spectrogram of shape (n_mels, 3000).
+    """
+    import whisper  # type: ignore
+
+    return whisper.log_mel_spectrogram(
+        whisper.pad_or_trim(audio), n_mels=n_mels
+    ).numpy()
+
+
+@st.cache_data(max_entries=32, ttl=3600, show_spinner=False)
+def compute_logmel(audio: np.ndarray, n_mels: int) -> np.ndarray:
+    """
+    Compute the Whisper log-mel spectrogram, cached by content.
+
+    Streamlit reruns on the same segment skip the computation.
+
+    Args:
+        audio (np.ndarray): Mono float32 waveform sampled at 16 kHz.
+        n_mels (int): The number of mel bins expected by the model.
+
+    Returns:
+        np.ndarray: A float32 log-mel spectrogram of shape (n_mels, 3000).
+    """
+    return logmel_spectrogram(audio, n_mels)
+
+
+@functools.cache
+def _language_names() -> MappingProxyType:
+    """
+    Load the read-only table of Whisper language codes to display names.
+
+    The table is a copy of Whisper's language list bundled as
+    ``babel/data/languages.json``, so looking up a name never imports Whisper.
+    It is read on first use. Keys and names are interned, and names are
+    title-cased once here instead of per call.
+
+    Returns:
+        MappingProxyType: The language names keyed by ISO 639-1 code.
+    """
+    languages = json.loads(
+        importlib.resources.files("babel")
+        .joinpath("data/languages.json")
+        .read_text(encoding="utf-8")
+    )
+    return MappingProxyType(
+        {sys.intern(code): sys.intern(name.title()) for code, name in languages.items()}
+    )
+
+
+@functools.cache
+def _scratch_dir() -> tempfile.TemporaryDirectory:
+    """
+    Create the scratch directory shared by this process.
+
+    Uploads are deleted individually by ``Saved.close``; the directory and
+    anything left in it are removed when the process exits.
+
+    Returns:
+        tempfile.TemporaryDirectory: The scratch directory.
+    """
+    return tempfile.TemporaryDirectory(prefix="babel_")
+
+
+_scratch_counter = itertools.count()
+
+
+def _new_scratch_path(suffix: str) -> str:
+    """
+    Mint a unique file path in the process scratch directory.
+
+    Names come from a counter, so no file is created until the caller opens it.
+
+    Args:
+        suffix (str): The file extension, including the leading dot.
+
+    Returns:
+        str: The path of the new scratch file.
+    """
+    return os.path.join(_scratch_dir().name, f"{next(_scratch_counter)}{suffix}")
+
+
+def as_waveform(audio: np.ndarray) -> np.ndarray:
+    """
+    Validate a decoded waveform and return it as contiguous float32 samples.
+
+    Arrays from ``Babel.slice_audio`` are returned as-is; other dtypes (e.g. int16
+    PCM) are converted once here rather than inside every feature extractor.
+    Signed PCM is scaled by its full range, so int16 maps -32768 to -1.0.
+
+    Args:
+        audio (np.ndarray): Mono waveform sampled at 16 kHz.
+
+    Returns:
+        np.ndarray: The waveform as a contiguous float32 array.
+
+    Raises:
+        ValueError: If the waveform is not a non-empty 1-D array or is unsigned PCM.
+    """
+    if audio.ndim != 1 or audio.size == 0:
+        logger.error(f"Expected a non-empty mono waveform, got shape {audio.shape}")
+        raise ValueError(f"Expected a non-empty mono waveform, got shape {audio.shape}")
+    if np.issubdtype(audio.dtype, np.unsignedinteger):
+        logger.error(f"Unsigned PCM is not supported, got dtype {audio.dtype}")
+        raise ValueError(f"Unsigned PCM is not supported, got dtype {audio.dtype}")
+    if np.issubdtype(audio.dtype, np.integer):
+        return audio.astype(np.float32) / -np.iinfo(audio.dtype).min
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+class _locked_cached_property(functools.cached_property):
+    """
+    A ``functools.cached_property`` whose first computation holds a lock.
+
+    Python 3.12 removed the lock from ``cached_property``, so threads accessing
+    it at the same time could each load a model or start a scheduler. Each
+    property has its own lock, so different models still load in parallel.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]) -> None:
+        super().__init__(func)
+        self._lock = threading.Lock()
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        if self.attrname not in cache:
+            with self._lock:
+                if self.attrname not in cache:
+                    cache[self.attrname] = self.func(instance)
+        return cache[self.attrname]
+
+
+@dataclass(frozen=True)
+class Saved:
+    """
+    Dataclass for an uploaded file saved to disk.
+
+    Instances can be passed anywhere a path is expected. Call ``close`` (or use
+    the instance as a context manager) once the file is no longer needed to
+    delete it.
+    """
+
+    path: str
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Delete the saved file.
+        """
+        Path(self.path).unlink(missing_ok=True)
+        logger.info(f"Removed temporary file: {self.path}")
+
+
+class BatchScheduler:
+    """
+    Coalesce requests from concurrent sessions into batched model calls.
+
+    Items submitted from any thread are queued and drained by one background
+    worker, which collects up to ``max_batch`` items arriving within
+    ``max_wait`` seconds and passes them to ``batch_fn`` in a single call.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[Any]], list[Any]],
+        name: str,
+        max_batch: int = MAX_BATCH_SIZE,
+        max_wait: float = 0.05,
+    ) -> None:
+        self.batch_fn = batch_fn
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: queue.Queue[tuple[Any, Future]] = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name=name, daemon=True)
+        self._worker.start()
+
+    def submit(self, item: Any) -> Future:
+        """
+        Queue an item for the next batch.
+
+        Args:
+            item (Any): The model input.
+
+        Returns:
+            Future: Resolves to the model output for this item.
+        """
+        future: Future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def _drain(self) -> list[tuple[Any, Future]]:
+        """
+        Block for the first queued item, then collect more until the batch is
+        full or the wait window has elapsed.
+
+        Returns:
+            list[tuple[Any, Future]]: The queued items and their futures.
+        """
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """
+        Worker loop running one model call per drained batch.
+        """
+        while True:
+            batch = self._drain()
+            try:
+                results = self.batch_fn([item for item, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"Expected {len(batch)} batch results, got {len(results)}."
+                    )
+            except Exception as e:
+                logger.exception(f"Batched inference failed: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            logger.debug(f"Processed batch of {len(batch)} items")
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
 
 class Babel:
-    def __init__(self) -> None:
-        self.device = self.get_device()
+    def __init__(self, device: str | None = None) -> None:
+        """
+        Initialize the Babel instance.
+
+        Args:
+            device (str | None, optional): The device for model inference. Read
+                from ``BABEL_DEVICE`` or detected if None. Defaults to None.
+        """
+        self.device = device or self.get_device()
+        if self.device == "cuda":
+            import torch
+
+            # cuDNN autotuning is left off: faster-whisper does not run on torch,
+            # and the classifier's padded batches vary in length, so every new
+            # shape would be tuned again
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
         models = load_model_env()
         self.dialect_model_id = models.dialect_model
+        self.dialect_precision = models.dialect_precision
         self.whisper_model_id = models.whisper_model
-        self._whisper_model: str | Any | None = None
-        self._classifier: Pipeline | None = None
+        self.whisper_backend = models.whisper_backend
+        self.lid_model_id = models.lid_model
+        # Models load on first use, or all at once through ``warm_up``. Dialect
+        # batches only touch the classifier when they run, so these start now.
+        self._dialect_schedulers = [
+            BatchScheduler(self._predict_dialect_batch, name=f"babel-dialect-{i}")
+            for i in range(len(DIALECT_BUCKETS))
+        ]
+        self._dialect_schedulers.append(
+            BatchScheduler(
+                self._predict_dialect_batch, name="babel-dialect-long", max_batch=1
+            )
+        )
         logger.info("Babel instance initialized.")
 
+    @_locked_cached_property
+    def whisper_model(self) -> Any:
+        """
+        The main Whisper model, loaded on first access.
+
+        Returns:
+            Any: The loaded Whisper model.
+        """
+        model = self.load_whisper_model(
+            self.whisper_model_id, self.device, self.whisper_backend
+        )
+        logger.info(
+            f"Whisper model '{self.whisper_model_id}' loaded on device '{self.device}'"
+        )
+        return model
+
+    @_locked_cached_property
+    def lid_model(self) -> Any | None:
+        """
+        The small Whisper model for the fast language check, loaded on first access.
+
+        Returns:
+            Any | None: The loaded Whisper model, or None if the check is disabled.
+        """
+        if not self.lid_model_id or self.lid_model_id == self.whisper_model_id:
+            return None
+        model = self.load_whisper_model(
+            self.lid_model_id, self.device, self.whisper_backend
+        )
+        logger.info(
+            f"Language ID model '{self.lid_model_id}' loaded on device '{self.device}'"
+        )
+        return model
+
+    @_locked_cached_property
+    def classifier(self) -> "Pipeline":
+        """
+        The dialect classification pipeline, loaded on first access.
+
+        Returns:
+            Pipeline: The loaded audio classification pipeline.
+        """
+        classifier = self.load_classifier(
+            self.dialect_model_id, self.device, self.dialect_precision
+        )
+        logger.info(
+            f"Audio classification model '{self.dialect_model_id}' loaded on device '{self.device}'"
+        )
+        return classifier
+
+    @_locked_cached_property
+    def _language_scheduler(self) -> BatchScheduler:
+        """
+        The scheduler batching language detection on the main Whisper model.
+
+        Returns:
+            BatchScheduler: The language detection scheduler.
+        """
+        # Sessions share the instance, so concurrent requests land in one batch
+        return self._create_language_scheduler(
+            self.whisper_model, name="babel-language"
+        )
+
+    @_locked_cached_property
+    def _lid_scheduler(self) -> BatchScheduler | None:
+        """
+        The scheduler batching the fast language check.
+
+        Returns:
+            BatchScheduler | None: The scheduler, or None if the check is disabled.
+        """
+        if self.lid_model is None:
+            return None
+        return self._create_language_scheduler(self.lid_model, name="babel-lid")
+
+    def warm_up(self) -> None:
+        """
+        Load all models in parallel and start their schedulers.
+
+        Loading is mostly disk reads and device copies, so the models load
+        concurrently. Without it, each model loads on first use; concurrent
+        first uses wait for a single load.
+        """
+        with ThreadPoolExecutor(thread_name_prefix="babel-load") as executor:
+            futures = [
+                executor.submit(getattr, self, name)
+                for name in ("whisper_model", "lid_model", "classifier")
+            ]
+            for future in futures:
+                future.result()
+        _ = self._language_scheduler, self._lid_scheduler
+        logger.info("Babel models loaded.")
+
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_device() -> str:
         """
         Determine the appropriate device for model inference.
 
+        A valid ``BABEL_DEVICE`` environment variable skips detection, so CUDA
+        is never initialized when the device is already known. The result is
+        cached: each availability check probes the driver.
+
         Returns:
             str: The device to be used for inference.
         """
+        override = os.getenv("BABEL_DEVICE", "").lower()
+        if override in DEVICES:
+            logger.info(f"Using device from BABEL_DEVICE: {override}")
+            return override
+        if override:
+            logger.warning(f"Ignoring unsupported BABEL_DEVICE '{override}'")
+
+        import torch
+
         device = (
             "cuda"
             if torch.cuda.is_available()
@@ -42,129 +475,378 @@ class Babel:
         return device
 
     @staticmethod
-    @st.cache_resource
-    def load_whisper_model(model_id: str, device: str) -> Any:
+    def load_whisper_model(
+        model_id: str, device: str, backend: str = "faster-whisper"
+    ) -> Any:
         """
         Load the Whisper model for language detection.
 
+        The "faster-whisper" backend runs the model with CTranslate2 using int8
+        weights (with fp16 activations on CUDA). CTranslate2 has no MPS support,
+        so it runs on the CPU there. The "openai" backend uses the reference
+        PyTorch implementation.
+
         Args:
             model_id (str): The identifier of the model to load.
             device (str): The device to load the model onto.
+            backend (str, optional): The Whisper implementation to use. Defaults to
+                "faster-whisper".
 
         Returns:
             Any: The loaded Whisper model.
+
+        Raises:
+            ValueError: If the backend is not supported.
         """
-        return whisper.load_model(name=model_id, device=device)
+        if backend not in WHISPER_BACKENDS:
+            logger.error(f"Unsupported Whisper backend: {backend}")
+            raise ValueError(f"Unsupported Whisper backend: {backend}")
+        if backend == "faster-whisper":
+            import faster_whisper
+
+            ct2_device = "cuda" if device == "cuda" else "cpu"
+            return faster_whisper.WhisperModel(
+                model_id,
+                device=ct2_device,
+                compute_type="int8_float16" if ct2_device == "cuda" else "int8",
+            )
+        import whisper  # type: ignore
+
+        model = whisper.load_model(name=model_id, device=device).eval()
+        if device == "cuda":
+            Babel.compile_encoder(model)
+        return model
 
     @staticmethod
-    @st.cache_resource
-    def load_classifier(model_id: str, device: str) -> Pipeline:
+    def compile_encoder(model: Any) -> None:
+        """
+        Compile the Whisper encoder and warm it up on a dummy spectrogram.
+
+        The encoder always sees a (n_mels, 3000) input, so the "reduce-overhead"
+        mode can capture it as a CUDA graph. If compilation fails, the model
+        keeps its eager encoder.
+
+        Args:
+            model (Any): The openai-whisper model, already on a CUDA device.
+        """
+        import torch
+        import whisper  # type: ignore
+
+        encoder = model.encoder
+        model.encoder = torch.compile(encoder, mode="reduce-overhead", fullgraph=True)
+        dummy = torch.zeros(
+            1, model.dims.n_mels, whisper.audio.N_FRAMES, device=model.device
+        )
+        try:
+            with torch.inference_mode(), torch.autocast("cuda", dtype=torch.float16):
+                model.encoder(dummy)
+        except Exception as e:
+            logger.warning(
+                f"Compiling the Whisper encoder failed, running eagerly: {e}"
+            )
+            model.encoder = encoder
+            return
+        logger.info("Whisper encoder compiled and warmed up")
+
+    @staticmethod
+    def compile_classifier(classifier: "Pipeline") -> None:
+        """
+        Compile the dialect model and warm it up on a second of silence.
+
+        Batches are padded to their longest waveform, so the model is compiled
+        with dynamic shapes rather than captured as CUDA graphs per shape. If
+        compilation fails, the pipeline keeps its eager model.
+
+        Args:
+            classifier (Pipeline): The audio classification pipeline, on CUDA.
+        """
+        import torch
+
+        model = classifier.model
+        classifier.model = torch.compile(model, dynamic=True)
+        dummy = {
+            "array": np.zeros(SAMPLE_RATE, dtype=np.float32),
+            "sampling_rate": SAMPLE_RATE,
+        }
+        try:
+            with torch.inference_mode():
+                classifier(dummy)
+        except Exception as e:
+            logger.warning(f"Compiling the dialect model failed, running eagerly: {e}")
+            classifier.model = model
+            return
+        logger.info("Dialect model compiled and warmed up")
+
+    @staticmethod
+    def load_classifier(
+        model_id: str, device: str, precision: str = "fp32"
+    ) -> "Pipeline":
         """
         Load the audio classification model.
 
+        With ``precision="int8"`` the linear layers are quantized: on CUDA the
+        weights are loaded in 8-bit via bitsandbytes, on CPU they are converted
+        with PyTorch dynamic quantization. ``precision="fp16"`` loads half
+        precision weights on CUDA and MPS. Unsupported combinations fall back
+        to fp32.
+
         Args:
             model_id (str): The identifier of the model to load.
             device (str): The device to load the model onto.
+            precision (str, optional): The model precision, "int8", "fp16" or
+                "fp32". Defaults to "fp32".
 
         Returns:
             Pipeline: The loaded audio classification pipeline.
+
+        Raises:
+            ValueError: If the precision is not supported.
         """
-        return pipeline(
-            task="audio-classification",
-            model=model_id,
-            device=device,
-        )
+        if precision not in DIALECT_PRECISIONS:
+            logger.error(f"Unsupported dialect model precision: {precision}")
+            raise ValueError(f"Unsupported dialect model precision: {precision}")
+
+        import torch
+        from transformers import BitsAndBytesConfig
+        from transformers.pipelines import pipeline
+
+        if precision == "int8" and device == "cuda":
+            # transformers needs accelerate as well to place 8-bit weights
+            missing = [
+                name
+                for name in ("bitsandbytes", "accelerate")
+                if importlib.util.find_spec(name) is None
+            ]
+            if not missing:
+                logger.info("Loading dialect model with 8-bit bitsandbytes weights")
+                return pipeline(
+                    task="audio-classification",
+                    model=model_id,
+                    device_map={"": device},
+                    model_kwargs={
+                        "quantization_config": BitsAndBytesConfig(load_in_8bit=True)
+                    },
+                )
+            logger.warning(
+                f"{' and '.join(missing)} not installed; loading fp32 dialect model"
+            )
+
+        if precision == "fp16" and device in ("cuda", "mps"):
+            logger.info("Loading dialect model with fp16 weights")
+            classifier = pipeline(
+                task="audio-classification",
+                model=model_id,
+                device=device,
+                dtype=torch.float16,
+            )
+        else:
+            if precision == "fp16":
+                logger.warning(f"fp16 is not supported on '{device}'; using fp32")
+            classifier = pipeline(
+                task="audio-classification",
+                model=model_id,
+                device=device,
+            )
+        if device == "cuda":
+            Babel.compile_classifier(classifier)
+        elif precision == "int8" and device == "cpu":
+            logger.info("Applying dynamic int8 quantization to dialect model")
+            classifier.model = torch.ao.quantization.quantize_dynamic(
+                classifier.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+        elif precision == "int8" and device != "cuda":
+            logger.warning(f"int8 is not supported on '{device}'; using fp32")
+        return classifier
+
+    def _n_mels(self, model: Any) -> int:
+        """
+        Get the number of mel bins expected by a Whisper model.
+
+        Args:
+            model (Any): The loaded Whisper model.
+
+        Returns:
+            int: The number of mel bins.
+        """
+        if self.whisper_backend == "faster-whisper":
+            return model.feature_extractor.mel_filters.shape[0]
+        return model.dims.n_mels
 
     @property
-    def whisper_model(self) -> Any:
+    def n_mels(self) -> int:
         """
-        Get the Whisper model for language detection.
+        Get the number of mel bins expected by the main Whisper model.
 
         Returns:
-            Any: The loaded Whisper model.
+            int: The number of mel bins.
+        """
+        return self._n_mels(self.whisper_model)
 
-        Raises:
-            RuntimeError: If the Whisper model is not loaded.
+    def _create_language_scheduler(self, model: Any, name: str) -> BatchScheduler:
         """
-        if self._whisper_model is None:
-            self._whisper_model = self.load_whisper_model(
-                self.whisper_model_id, self.device
+        Create a batch scheduler running language detection with a Whisper model.
+
+        Args:
+            model (Any): The loaded Whisper model.
+            name (str): The name of the scheduler's worker thread.
+
+        Returns:
+            BatchScheduler: The language detection scheduler.
+        """
+        if self.whisper_backend == "faster-whisper":
+            return BatchScheduler(
+                functools.partial(self._detect_language_batch_faster_whisper, model),
+                name=name,
             )
-            logger.info(
-                f"Whisper model '{self.whisper_model_id}' loaded on device '{self.device}'"
+        import torch
+        import whisper  # type: ignore
+        from whisper.tokenizer import get_tokenizer  # type: ignore
+
+        pinned: "torch.Tensor | None" = None
+        if self.device == "cuda":
+            # Page-locked staging buffer for asynchronous host-to-device mel copies
+            pinned = torch.empty(
+                (MAX_BATCH_SIZE, self._n_mels(model), whisper.audio.N_FRAMES),
+                dtype=torch.float32,
+                pin_memory=True,
             )
-        if self._whisper_model is None:
-            logger.error("Whisper model is not loaded.")
-            raise RuntimeError("Whisper model is not loaded.")
-        return self._whisper_model
+        tokenizer = get_tokenizer(
+            model.is_multilingual, num_languages=model.num_languages
+        )
+        return BatchScheduler(
+            functools.partial(
+                self._detect_language_batch_openai,
+                model,
+                pinned,
+                torch.tensor(tokenizer.all_language_tokens, device=model.device),
+                tokenizer.all_language_codes,
+                tokenizer.sot,
+            ),
+            name=name,
+        )
 
-    @property
-    def classifier(self) -> Pipeline:
+    @staticmethod
+    def _detect_language_batch_faster_whisper(
+        model: Any, mels: list[np.ndarray]
+    ) -> list[tuple[str, float]]:
         """
-        Get the audio classification pipeline.
+        Run faster-whisper language detection on a batch of log-mel spectrograms.
+
+        Args:
+            model (Any): The loaded faster-whisper model.
+            mels (list[np.ndarray]): Log-mel spectrograms of shape (n_mels, 3000).
 
         Returns:
-            Pipeline: The loaded audio classification pipeline.
+            list[tuple[str, float]]: The most likely language code and its
+                probability for each spectrogram.
+        """
+        encoder_output = model.encode(np.stack(mels))
+        results = model.model.detect_language(encoder_output)
+        # Results are sorted by probability; tokens look like "<|ar|>"
+        return [
+            (result[0][0][2:-2], result[0][1]) if result else ("", 0.0)
+            for result in results
+        ]
 
-        Raises:
-            RuntimeError: If the classifier model is not loaded.
+    @staticmethod
+    def _detect_language_batch_openai(
+        model: Any,
+        pinned: "torch.Tensor | None",
+        token_ids: "torch.Tensor",
+        codes: tuple[str, ...],
+        sot: int,
+        mels: list[np.ndarray],
+    ) -> list[tuple[str, float]]:
         """
-        if self._classifier is None:
-            self._classifier = self.load_classifier(self.dialect_model_id, self.device)
-            logger.info(
-                f"Audio classification model '{self.dialect_model_id}' loaded on device '{self.device}'"
-            )
-        if self._classifier is None:
-            logger.error("Classifier model is not loaded.")
-            raise RuntimeError("Classifier model is not loaded.")
-        return self._classifier
+        Run openai-whisper language detection on a batch of log-mel spectrograms.
+
+        Args:
+            model (Any): The loaded openai-whisper model.
+            pinned (torch.Tensor | None): Pinned staging buffer for CUDA copies, or
+                None to copy directly.
+            token_ids (torch.Tensor): The language token ids on the model's device.
+            codes (tuple[str, ...]): The language code of each token id.
+            sot (int): The start-of-transcript token.
+            mels (list[np.ndarray]): Log-mel spectrograms of shape (n_mels, 3000).
+
+        Returns:
+            list[tuple[str, float]]: The most likely language code and its
+                probability for each spectrogram.
+        """
+        import torch
 
-    def detect_language(self, audio_path: str) -> str:
+        if pinned is not None:
+            # Only the scheduler thread touches the buffer, and detection syncs on
+            # its results before the next batch overwrites it
+            staged = pinned[: len(mels)]
+            np.stack(mels, out=staged.numpy())
+            mel_batch = staged.to(model.device, non_blocking=True)
+        else:
+            mel_batch = torch.from_numpy(np.stack(mels)).to(model.device)
+        on_cuda = mel_batch.device.type == "cuda"
+        with (
+            torch.inference_mode(),
+            torch.autocast("cuda", dtype=torch.float16, enabled=on_cuda),
+        ):
+            # One decoder step from the start-of-transcript token, restricted to
+            # the language tokens, without building a probability dict per item
+            audio_features = model.embed_audio(mel_batch)
+            tokens = torch.full((len(mels), 1), sot, device=model.device)
+            logits = model.logits(tokens, audio_features)[:, 0, token_ids]
+            best_probs, best_ids = logits.float().softmax(dim=-1).max(dim=-1)
+        return [
+            (codes[index], prob)
+            for index, prob in zip(best_ids.tolist(), best_probs.tolist())
+        ]
+
+    def _predict_dialect_batch(
+        self, audios: list[np.ndarray], batch_size: int | None = None
+    ) -> list[Any]:
         """
-        Detect the language of the audio file using Whisper.
+        Run the dialect classifier on a batch of waveforms.
 
         Args:
-            audio_path (str): Path to the audio file.
+            audios (list[np.ndarray]): Mono float32 waveforms sampled at 16 kHz.
+            batch_size (int | None, optional): The classifier batch size. Runs all
+                waveforms in one batch if None. Defaults to None.
 
         Returns:
-            str: Detected language code.
+            list[Any]: The raw pipeline predictions for each waveform.
+        """
+        import torch
 
-        Raises:
-            ValueError: If language detection fails.
-        """
-        audio = whisper.load_audio(audio_path)
-        mel = whisper.log_mel_spectrogram(
-            audio, n_mels=self.whisper_model.dims.n_mels
-        ).to(self.whisper_model.device)
-        _, probs = self.whisper_model.detect_language(mel)
-        if not probs:
-            logger.error("Language detection failed; no probabilities returned.")
-            raise ValueError("Language detection failed; no probabilities returned.")
-        language = str(max(probs, key=probs.get))
-        logger.info(f"Detected language: {language}")
-        return language
+        inputs = [{"array": audio, "sampling_rate": SAMPLE_RATE} for audio in audios]
+        # The pipeline only disables grad; inference mode also skips version counters.
+        # Autocast keeps softmax and normalization in fp32 around fp16 weights.
+        with (
+            torch.inference_mode(),
+            torch.autocast(
+                "cuda",
+                dtype=torch.float16,
+                enabled=self.device == "cuda" and self.dialect_precision == "fp16",
+            ),
+        ):
+            return self.classifier(inputs, batch_size=batch_size or len(inputs))
 
-    def predict_dialect(self, file: str) -> list[dict[str, Any]]:
+    @staticmethod
+    def _to_dialects(predictions: Any) -> Sequence[dict[str, Any]]:
         """
-        Detect the dialect of the given audio file.
+        Normalize the classifier output for one waveform and log the best dialect.
 
         Args:
-            file (str): Path to the audio file.
+            predictions (Any): The raw pipeline predictions for one waveform.
 
         Returns:
-            list[dict[str, Any]]: The classification predictions.
+            Sequence[dict[str, Any]]: The classification predictions.
         """
-        predictions = self.classifier(file)
-        if not isinstance(predictions, list):
-            if isinstance(predictions, (list, tuple)):
-                predictions = list(predictions)
-            else:
-                predictions = [predictions]
-        dialects = [
-            dict(prediction)
-            for prediction in predictions
-            if isinstance(prediction, dict)
-        ]
+        # The audio-classification pipeline already returns a list of dicts, which
+        # passes through uncopied; a lone dict gets a one-element tuple
+        if isinstance(predictions, dict):
+            dialects: Sequence[dict[str, Any]] = (predictions,)
+        elif isinstance(predictions, (list, tuple)):
+            dialects = predictions
+        else:
+            dialects = tuple(predictions)
         if dialects:
             best_result = max(dialects, key=lambda x: x.get("score", 0))
             best_dialect = best_result.get("label", "unknown")
@@ -174,7 +856,88 @@ class Babel:
             )
             return dialects
         logger.info("No dialects predicted.")
-        return []
+        return ()
+
+    def detect_language(self, audio: np.ndarray, mel: np.ndarray | None = None) -> str:
+        """
+        Detect the language of the audio segment using Whisper.
+
+        The small language ID model first checks the start of the segment. Only
+        if it is not confident the audio is Arabic does the main model run.
+
+        Args:
+            audio (np.ndarray): Mono float32 waveform sampled at 16 kHz.
+            mel (np.ndarray | None, optional): A log-mel spectrogram already
+                computed by ``load_segment``. Computed from ``audio`` if None.
+                Defaults to None.
+
+        Returns:
+            str: Detected language code.
+
+        Raises:
+            ValueError: If the waveform is invalid or language detection fails.
+        """
+        audio = as_waveform(audio)
+        if self.lid_model is not None and self._lid_scheduler is not None:
+            lid_mel = compute_logmel(audio[:LID_SAMPLES], self._n_mels(self.lid_model))
+            language, probability = self._lid_scheduler.submit(lid_mel).result()
+            if language == "ar" and probability > LID_CONFIDENCE:
+                logger.info(f"Detected language: ar (fast path, p={probability:.2f})")
+                return "ar"
+        if mel is None:
+            mel = compute_logmel(audio, self.n_mels)
+        language, _ = self._language_scheduler.submit(mel).result()
+        if not language:
+            logger.error("Language detection failed; no probabilities returned.")
+            raise ValueError("Language detection failed; no probabilities returned.")
+        logger.info(f"Detected language: {language}")
+        return language
+
+    def predict_dialect(self, audio: np.ndarray) -> Sequence[dict[str, Any]]:
+        """
+        Detect the dialect of the given audio segment.
+
+        Args:
+            audio (np.ndarray): Mono float32 waveform sampled at 16 kHz.
+
+        Returns:
+            Sequence[dict[str, Any]]: The classification predictions.
+
+        Raises:
+            ValueError: If the waveform is invalid.
+        """
+        audio = as_waveform(audio)
+        # Batch similar lengths together to limit padding inside the classifier
+        bucket = bisect.bisect(DIALECT_BUCKETS, audio.size / SAMPLE_RATE)
+        predictions = self._dialect_schedulers[bucket].submit(audio).result()
+        return self._to_dialects(predictions)
+
+    def predict_dialects(
+        self, audios: list[np.ndarray], batch_size: int = MAX_BATCH_SIZE
+    ) -> list[Sequence[dict[str, Any]]]:
+        """
+        Detect the dialects of several audio segments in one classifier call.
+
+        Unlike ``predict_dialect``, this bypasses the shared request scheduler and
+        runs the given segments directly in batches of ``batch_size``.
+
+        Args:
+            audios (list[np.ndarray]): Mono float32 waveforms sampled at 16 kHz.
+            batch_size (int, optional): The classifier batch size. Defaults to
+                MAX_BATCH_SIZE.
+
+        Returns:
+            list[Sequence[dict[str, Any]]]: The classification predictions for each
+                segment, in input order.
+
+        Raises:
+            ValueError: If any waveform is invalid.
+        """
+        waveforms = [as_waveform(audio) for audio in audios]
+        if not waveforms:
+            return []
+        predictions = self._predict_dialect_batch(waveforms, batch_size=batch_size)
+        return [self._to_dialects(prediction) for prediction in predictions]
 
     @staticmethod
     def get_language_name(language_code: str) -> str:
@@ -187,81 +950,462 @@ class Babel:
         Returns:
             str: The full name of the language.
         """
-        language = LANGUAGES.get(language_code, "Unknown").title()
+        language = _language_names().get(sys.intern(language_code), "Unknown")
         logger.info(
             f"Language code '{language_code}' corresponds to language '{language}'"
         )
         return language
 
     @staticmethod
-    def save_uploaded_file(uploaded_file: Any) -> str:
+    def save_uploaded_file(uploaded_file: Any) -> Saved:
         """
-        Save uploaded file to a temporary file and return the path.
+        Save uploaded file to a temporary file.
+
+        File-like uploads are streamed to disk in 1 MiB chunks. Objects without a
+        ``read`` method must provide ``getvalue``. The file lives in a scratch
+        directory; ``Saved.close`` deletes it, and anything left over is removed
+        when the process exits.
 
         Args:
             uploaded_file (Any): The uploaded file object from Streamlit.
 
         Returns:
-            str: The path to the saved temporary file.
+            Saved: The saved temporary file. The caller is responsible for closing
+                it.
+
+        Raises:
+            ValueError: If the uploaded file is empty.
         """
         suffix = Path(uploaded_file.name).suffix
         if not suffix:
             suffix = ".mp3"  # Default to mp3 if no extension found
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            logger.info(f"Uploaded file saved to temporary path: {tmp_file.name}")
-            return tmp_file.name
+        with open(_new_scratch_path(suffix), "wb") as tmp_file:
+            if hasattr(uploaded_file, "read"):
+                # Stream in chunks rather than materialising a second copy
+                uploaded_file.seek(0)
+                shutil.copyfileobj(uploaded_file, tmp_file, length=1024 * 1024)
+            else:
+                tmp_file.write(uploaded_file.getvalue())
+            path = tmp_file.name
+        logger.info(f"Uploaded file saved to temporary path: {path}")
+
+        if os.path.getsize(path) == 0:
+            Path(path).unlink()
+            logger.error("The uploaded file is empty.")
+            raise ValueError("The uploaded file is empty.")
+        return Saved(path=path)
 
     @staticmethod
-    def slice_audio(input_path: str, start_time: str | float, duration: float) -> str:
+    def parse_time(value: str | float) -> float:
         """
-        Slice audio file using ffmpeg and convert to WAV.
+        Convert a timestamp to seconds.
 
         Args:
-            input_path (str): Path to the input audio file.
+            value (str | float): Time in seconds or "hh:mm:ss" / "mm:ss" format.
+
+        Returns:
+            float: The time in seconds.
+
+        Raises:
+            ValueError: If the timestamp cannot be parsed.
+        """
+        if isinstance(value, (int, float)):
+            return float(value)
+        seconds = 0.0
+        for part in str(value).strip().split(":"):
+            seconds = seconds * 60 + float(part)
+        return seconds
+
+    def load_segment(
+        self,
+        path: str | os.PathLike[str],
+        start_time: str | float,
+        duration: float,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Decode a segment of an uploaded file and compute its Whisper log-mel.
+
+        Args:
+            path (str | os.PathLike[str]): Path to the saved upload, e.g. the
+                ``Saved`` returned by ``save_uploaded_file``.
             start_time (str | float): Start time in seconds or "hh:mm:ss" format.
             duration (float): Duration in seconds.
 
         Returns:
-            str: Path to the sliced temporary audio file (WAV format).
+            tuple[np.ndarray, np.ndarray]: The mono float32 waveform and its
+                log-mel spectrogram.
+        """
+        return load_segment(os.fspath(path), start_time, duration, self.n_mels)
+
+    @staticmethod
+    def slice_audio(
+        input_path: str | os.PathLike[str] | BinaryIO,
+        start_time: str | float,
+        duration: float,
+    ) -> np.ndarray:
+        """
+        Decode a segment of an audio or video file in-process using PyAV.
+
+        The audio stream is resampled to 16 kHz mono, which is the input format
+        expected by both Whisper and the dialect classifier.
+
+        Args:
+            input_path (str | os.PathLike[str] | BinaryIO): Path to the input file,
+                e.g. a ``Saved`` upload, or a binary file object.
+            start_time (str | float): Start time in seconds or "hh:mm:ss" format.
+            duration (float): Duration in seconds.
+
+        Returns:
+            np.ndarray: The decoded segment as a mono float32 waveform.
 
         Raises:
-            ValueError: If the sliced audio file is empty.
-        """
-        # Force .wav extension for the output to ensure compatibility
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp_file:
-            output_path = tmp_file.name
-
-        # ffmpeg -ss <start> -t <duration> -i <input> -vn -acodec pcm_s16le -ar 16000 <output>
-        command = [
-            "ffmpeg",
-            "-y",
-            "-ss",
-            str(start_time),
-            "-t",
-            str(duration),
-            "-i",
-            input_path,
-            "-vn",  # No video
-            "-acodec",
-            "pcm_s16le",  # PCM 16-bit little endian
-            "-ar",
-            "16000",  # 16kHz sample rate
-            "-ac",
-            "1",  # Mono
-            output_path,
-        ]
+            ValueError: If the file cannot be decoded, has no audio stream, or the
+                sliced audio segment is empty.
+        """
+        with Babel._open_container(input_path) as container:
+            return Babel._decode_segment(
+                container, Babel.parse_time(start_time), duration
+            )
+
+    @staticmethod
+    def slice_audio_many(
+        input_path: str | os.PathLike[str] | BinaryIO,
+        segments: Sequence[tuple[str | float, float]],
+        thread_count: int | None = None,
+    ) -> list[np.ndarray]:
+        """
+        Decode several segments of an audio or video file, opening it only once.
+
+        Args:
+            input_path (str | os.PathLike[str] | BinaryIO): Path to the input file,
+                e.g. a ``Saved`` upload, or a binary file object.
+            segments (Sequence[tuple[str | float, float]]): (start time, duration)
+                pairs, with start times in seconds or "hh:mm:ss" format.
+            thread_count (int | None, optional): Decoder threads, or FFmpeg's
+                default if None. Defaults to None.
+
+        Returns:
+            list[np.ndarray]: The decoded segments as mono float32 waveforms, in
+                input order.
+
+        Raises:
+            ValueError: If the file cannot be decoded, has no audio stream, or any
+                sliced audio segment is empty.
+        """
+        audios = []
+        with Babel._open_container(input_path, thread_count) as container:
+            for index, (start_time, duration) in enumerate(segments):
+                start = Babel.parse_time(start_time)
+                if index and start <= 0:
+                    # Later segments seek themselves; rewind for one at the start
+                    container.seek(0)
+                audios.append(Babel._decode_segment(container, start, duration))
+        return audios
+
+    @staticmethod
+    def slice_audio_parallel(
+        input_path: str | os.PathLike[str] | bytes,
+        segments: Sequence[tuple[str | float, float]],
+        max_workers: int = 4,
+        threads_per_worker: int | None = None,
+    ) -> list[np.ndarray]:
+        """
+        Decode several segments of an audio or video file on a thread pool.
+
+        The segments are split into contiguous runs, one per worker. Each worker
+        opens its own container and decodes its run with ``slice_audio_many``.
+        FFmpeg releases the GIL while decoding, so the workers run in parallel.
+        Unlike ``slice_audio_many``, this does not take a file object: every
+        worker needs its own read position, so in-memory uploads are passed as
+        bytes and each worker wraps them in its own buffer.
+
+        Args:
+            input_path (str | os.PathLike[str] | bytes): Path to the input file,
+                e.g. a ``Saved`` upload, or its contents.
+            segments (Sequence[tuple[str | float, float]]): (start time, duration)
+                pairs, with start times in seconds or "hh:mm:ss" format.
+            max_workers (int, optional): The maximum number of worker threads.
+                Defaults to 4.
+            threads_per_worker (int | None, optional): Decoder threads per worker.
+                Splits the CPU count between the workers if None. Defaults to None.
+
+        Returns:
+            list[np.ndarray]: The decoded segments as mono float32 waveforms, in
+                input order.
+
+        Raises:
+            ValueError: If the file cannot be decoded, has no audio stream, or any
+                sliced audio segment is empty.
+        """
+        if not segments:
+            return []
+        workers = max(1, min(max_workers, len(segments)))
+        threads = threads_per_worker or max(1, (os.cpu_count() or 1) // workers)
+        run_size = -(-len(segments) // workers)
+        runs = [segments[i : i + run_size] for i in range(0, len(segments), run_size)]
 
-        subprocess.run(
-            command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        def decode_run(run: Sequence[tuple[str | float, float]]) -> list[np.ndarray]:
+            # File objects keep a position, so every worker needs its own
+            source = (
+                io.BytesIO(input_path) if isinstance(input_path, bytes) else input_path
+            )
+            return Babel.slice_audio_many(source, run, thread_count=threads)
+
+        with ThreadPoolExecutor(
+            max_workers=len(runs), thread_name_prefix="babel-slice"
+        ) as executor:
+            return [
+                audio for audios in executor.map(decode_run, runs) for audio in audios
+            ]
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _open_container(
+        input_path: str | os.PathLike[str] | BinaryIO, thread_count: int | None = None
+    ) -> Iterator[Any]:
+        """
+        Open a media file with PyAV, reporting FFmpeg failures as ValueError.
+
+        If the file name (or the ``name`` of a file object) has an extension in
+        ``PROBE_FORMATS``, the demuxer is forced and probing is minimal. Should
+        that fail, e.g. for a mislabeled upload, the file is opened normally.
+
+        Args:
+            input_path (str | os.PathLike[str] | BinaryIO): Path to the input file,
+                e.g. a ``Saved`` upload, or a binary file object.
+            thread_count (int | None, optional): Decoder threads, or FFmpeg's
+                default if None. Defaults to None.
+
+        Yields:
+            Any: The open PyAV input container.
+
+        Raises:
+            ValueError: If the file cannot be opened or decoded, or it has no audio
+                stream.
+        """
+        # PyAV only treats str as a path and anything else as a file object
+        if isinstance(input_path, os.PathLike):
+            input_path = os.fspath(input_path)
+        name = (
+            input_path
+            if isinstance(input_path, str)
+            else getattr(input_path, "name", "")
+        )
+        container = None
+        format_name = PROBE_FORMATS.get(Path(name).suffix.lower()) if name else None
+        if format_name is not None:
+            try:
+                container = av.open(
+                    input_path, format=format_name, options=dict(FAST_PROBE_OPTIONS)
+                )
+            except av.error.FFmpegError as e:
+                logger.warning(
+                    f"Opening as '{format_name}' failed, probing instead: {e}"
+                )
+                if not isinstance(input_path, str):
+                    input_path.seek(0)
+        if container is None:
+            try:
+                container = av.open(input_path)
+            except av.error.FFmpegError as e:
+                logger.error(f"Failed to open media file: {e}")
+                raise ValueError(f"Failed to open media file: {e}") from e
+        with container:
+            # Fail before decoding anything, e.g. for a video without sound
+            if not container.streams.audio:
+                logger.error("The file has no audio stream.")
+                raise ValueError("The file has no audio stream.")
+            if thread_count is not None:
+                container.streams.audio[0].codec_context.thread_count = thread_count
+            try:
+                yield container
+            except av.error.FFmpegError as e:
+                logger.error(f"Failed to decode audio: {e}")
+                raise ValueError(f"Failed to decode audio: {e}") from e
+
+    @staticmethod
+    def _decode_segment(container: Any, start: float, duration: float) -> np.ndarray:
+        """
+        Decode a segment from an open PyAV container into a 16 kHz mono waveform.
+
+        Args:
+            container (Any): The open PyAV input container.
+            start (float): Start time in seconds.
+            duration (float): Duration in seconds.
+
+        Returns:
+            np.ndarray: The decoded segment as a mono float32 waveform, shorter than
+                ``duration`` if the file ends first.
+
+        Raises:
+            ValueError: If the start time is past the end of the file or the
+                sliced audio segment is empty.
+        """
+        n_samples = int(duration * SAMPLE_RATE)
+        capacity = n_samples
+        # The container header usually knows the length, so an out-of-range start
+        # fails before any seeking or decoding
+        if container.duration is not None:
+            file_duration = container.duration / av.time_base
+            # Size the buffer for what the file holds, not the requested duration;
+            # header durations can be estimates, so leave a second of slack
+            remaining = int((file_duration - start) * SAMPLE_RATE) + SAMPLE_RATE
+            capacity = min(n_samples, remaining)
+            if start >= file_duration:
+                logger.error(
+                    f"Start time {start:.2f}s is past the end of the file ({file_duration:.2f}s)."
+                )
+                raise ValueError(
+                    f"Start time {start:.2f}s is past the end of the file ({file_duration:.2f}s)."
+                )
+        # Packed float32 output needs no integer conversion or rescaling afterwards.
+        # swresample only normalises the downmix matrix for integer output, so
+        # without rematrix_maxval a stereo float downmix is 3 dB louder than s16
+        resampler = av.AudioResampler(
+            format="flt",
+            layout="mono",
+            rate=SAMPLE_RATE,
+            options={"rematrix_maxval": "1.0"},
         )
+        # Decoded samples are copied straight into the output buffer
+        audio = np.empty(capacity, dtype=np.float32)
+        filled = 0
+        skip: int | None = None
+
+        # Timestamps are absolute, but ``start`` is relative to the start of the
+        # file like ffmpeg's -ss; MP3s, for example, start after encoder priming
+        offset = container.start_time or 0
+        target = start + offset / av.time_base
+        if start > 0:
+            # Seek lands on the closest keyframe before ``start``
+            container.seek(int(start * av.time_base) + offset)
+        # A trailing ``None`` flushes the samples buffered in the resampler
+        for frame in itertools.chain(container.decode(audio=0), [None]):
+            if skip is None and frame is not None:
+                frame_time = frame.time or 0.0
+                skip = max(0, round((target - frame_time) * SAMPLE_RATE))
+            for resampled in resampler.resample(frame):
+                chunk = resampled.to_ndarray().reshape(-1)
+                if skip:
+                    dropped = min(skip, chunk.size)
+                    chunk = chunk[dropped:]
+                    skip -= dropped
+                count = min(chunk.size, n_samples - filled)
+                if filled + count > audio.size:
+                    # The file is longer than its header claimed
+                    grown = np.empty(
+                        min(n_samples, max(2 * audio.size, filled + count)),
+                        dtype=np.float32,
+                    )
+                    grown[:filled] = audio[:filled]
+                    audio = grown
+                audio[filled : filled + count] = chunk[:count]
+                filled += count
+            if filled >= n_samples:
+                break
 
-        if Path(output_path).stat().st_size == 0:
-            logger.error("Sliced audio file is empty. Check start time and duration.")
+        if filled == 0:
+            logger.error(
+                "Sliced audio segment is empty. Check start time and duration."
+            )
             raise ValueError(
-                "Sliced audio file is empty. Check start time and duration."
+                "Sliced audio segment is empty. Check start time and duration."
             )
-        logger.info(f"Sliced audio file created at: {output_path}")
+        logger.info(f"Sliced {filled / SAMPLE_RATE:.2f}s of audio")
+
+        if 2 * filled < audio.size:
+            # A view would keep the mostly unused buffer alive
+            return audio[:filled].copy()
+        return audio[:filled]
+
+
+def preprocess_segment(
+    path: str,
+    start_time: str | float,
+    duration: float,
+    n_mels: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decode a segment and compute its log-mel spectrogram.
+
+    This is a module-level function so it can be pickled into the
+    preprocessing worker processes. Workers read the file from disk, so only
+    the path crosses the process boundary.
+
+    Args:
+        path (str): Path to the saved upload.
+        start_time (str | float): Start time in seconds or "hh:mm:ss" format.
+        duration (float): Duration in seconds.
+        n_mels (int): The number of mel bins expected by the Whisper model.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The mono float32 waveform and its
+            log-mel spectrogram.
+    """
+    audio = Babel.slice_audio(path, start_time, duration)
+    return audio, logmel_spectrogram(audio, n_mels)
+
+
+@st.cache_resource
+def get_preprocess_executor() -> ProcessPoolExecutor:
+    """
+    Get the process pool shared by all sessions for CPU-bound preprocessing.
+
+    Decoding in worker processes lets the next upload be prepared while the
+    models are busy with the current one. Workers are spawned rather than
+    forked so they never inherit an initialised CUDA context.
+
+    Returns:
+        ProcessPoolExecutor: The preprocessing pool.
+    """
+    max_workers = max(1, (os.cpu_count() or 2) // 2)
+    logger.info(f"Starting preprocessing pool with {max_workers} workers")
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+@st.cache_data(max_entries=32, ttl=3600, show_spinner=False)
+def load_segment(
+    path: str,
+    start_time: str | float,
+    duration: float,
+    n_mels: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Preprocess a segment in the worker pool, cached by file and segment.
+
+    Streamlit reruns the script on every widget interaction; caching keyed on
+    the saved upload's path and segment bounds avoids decoding the same segment
+    again. Scratch paths are never reused within a process, so a path always
+    refers to the same contents.
+    If a worker has died and broken the pool, the pool is replaced and the
+    segment is submitted once more.
+
+    Args:
+        path (str): Path to the saved upload.
+        start_time (str | float): Start time in seconds or "hh:mm:ss" format.
+        duration (float): Duration in seconds.
+        n_mels (int): The number of mel bins expected by the Whisper model.
 
-        return output_path
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The mono float32 waveform and its
+            log-mel spectrogram.
+    """
+    executor = get_preprocess_executor()
+    try:
+        return executor.submit(
+            preprocess_segment, path, start_time, duration, n_mels
+        ).result()
+    except BrokenProcessPool:
+        # A dead worker (e.g. OOM-killed) breaks the shared pool for every
+        # session, so replace it unless another session already has
+        logger.warning("Preprocessing pool is broken; restarting it")
+        if get_preprocess_executor() is executor:
+            get_preprocess_executor.clear()
+        executor.shutdown(wait=False)
+    future = get_preprocess_executor().submit(
+        preprocess_segment, path, start_time, duration, n_mels
+    )
+    return future.result()
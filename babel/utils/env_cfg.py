@@ -7,6 +7,17 @@ from loguru import logger
 
 load_dotenv()
 
+_TRUTHY = frozenset({"1", "true", "yes"})
+_OFFLINE_ENV = {
+    "HF_HUB_OFFLINE": "1",
+    "TRANSFORMERS_OFFLINE": "1",
+    "HF_HUB_DISABLE_TELEMETRY": "1",
+    "HF_HUB_DISABLE_PROGRESS_BARS": "1",
+    "HF_HUB_DISABLE_SYMLINKS_WARNING": "1",
+    "KMP_DUPLICATE_LIB_OK": "TRUE",
+}
+_OFFLINE_APPLIED = False
+
 
 @dataclass(frozen=True)
 class ModelConfig:
@@ -15,7 +26,10 @@ class ModelConfig:
     """
 
     dialect_model: str
+    dialect_precision: str
     whisper_model: str
+    whisper_backend: str
+    lid_model: str
 
 
 @dataclass(frozen=True)
@@ -35,14 +49,25 @@ def load_model_env() -> ModelConfig:
     Returns:
         ModelConfig: Dataclass containing model configuration.
         - dialect_model (str): The dialect model identifier.
+        - dialect_precision (str): The dialect model precision ("int8", "fp16" or "fp32").
         - whisper_model (str): The Whisper model identifier.
+        - whisper_backend (str): The Whisper implementation ("faster-whisper" or "openai").
+        - lid_model (str): The small Whisper model for the fast language check.
     """
     default_dialect_model = "badrex/mms-300m-arabic-dialect-identifier"
+    default_dialect_precision = "int8"
     default_whisper_model = "turbo"
+    default_whisper_backend = "faster-whisper"
+    default_lid_model = "tiny"
 
     return ModelConfig(
         dialect_model=os.getenv("DIALECT_MODEL", default_dialect_model),
+        dialect_precision=os.getenv(
+            "DIALECT_PRECISION", default_dialect_precision
+        ).lower(),
         whisper_model=os.getenv("WHISPER_MODEL", default_whisper_model),
+        whisper_backend=os.getenv("WHISPER_BACKEND", default_whisper_backend).lower(),
+        lid_model=os.getenv("LID_MODEL", default_lid_model),
     )
 
 
@@ -83,17 +108,18 @@ def set_offline_env() -> None:
 
     Note:
     Call this function before importing `transformers` or `llama_index` to ensure
-    the offline mode is applied correctly.
+    the offline mode is applied correctly. Only the first call in a process has
+    an effect, so Streamlit reruns do not reapply it.
     """
-    babel_offline = os.getenv("BABEL_OFFLINE", "1").lower() in {"1", "true", "yes"}
+    global _OFFLINE_APPLIED
+    if _OFFLINE_APPLIED:
+        return
+    _OFFLINE_APPLIED = True
+
+    babel_offline = os.getenv("BABEL_OFFLINE", "1").lower() in _TRUTHY
 
     if babel_offline:
-        os.environ["HF_HUB_OFFLINE"] = "1"
-        os.environ["TRANSFORMERS_OFFLINE"] = "1"
-        os.environ["HF_HUB_DISABLE_TELEMETRY"] = "1"
-        os.environ["HF_HUB_DISABLE_PROGRESS_BARS"] = "1"
-        os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
-        os.environ["KMP_DUPLICATE_LIB_OK"] = "TRUE"
+        os.environ.update(_OFFLINE_ENV)
         logger.info("Set Hugging Face libraries to offline mode.")
     else:
         logger.info("Hugging Face libraries are in online mode.")
@@ -4,6 +4,7 @@ from pathlib import Path
 import whisper  # type: ignore
 
 from dotenv import load_dotenv
+from faster_whisper.utils import download_model
 from huggingface_hub import snapshot_download
 from loguru import logger
 
@@ -64,15 +65,19 @@ def load_hf_model(model_id: str, cache_folder: Path) -> None:
     logger.info("Loaded model: {}", model_id)
 
 
-def load_whisper_model(model_id: str) -> None:
+def load_whisper_model(model_id: str, backend: str) -> None:
     """
     Loads and returns the Whisper model.
 
     Args:
         model_id (str): The name of the model to load.
+        backend (str): The Whisper implementation the model is loaded for.
     """
-    whisper.load_model("turbo")
-    logger.info("Loaded whisper model: {}", model_id)
+    if backend == "faster-whisper":
+        download_model(model_id)
+    else:
+        whisper.load_model(model_id)
+    logger.info("Loaded {} whisper model: {}", backend, model_id)
 
 
 def main() -> None:
@@ -97,7 +102,9 @@ def main() -> None:
     )
 
     # Whisper
-    load_whisper_model(models.whisper_model)
+    load_whisper_model(models.whisper_model, models.whisper_backend)
+    if models.lid_model:
+        load_whisper_model(models.lid_model, models.whisper_backend)
 
     logger.info("All models loaded successfully.")
 
@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from babel.core import Babel
+
+
+@pytest.fixture(scope="session")
+def babel_session() -> Babel:
+    """
+    Create one Babel instance with mock models for the whole test session.
+
+    Models load lazily, so assigning mocks to the cached properties means no
+    loader ever runs and nothing needs patching.
+
+    Returns:
+        Babel: The Babel instance with mock models.
+    """
+    babel = Babel(device="cpu")
+    babel.whisper_model = MagicMock()
+    babel.lid_model = None
+    babel.classifier = MagicMock()
+    return babel
+
+
+@pytest.fixture
+def babel_stub(babel_session: Babel) -> Babel:
+    """
+    Provide the shared Babel instance with freshly reset mock models.
+
+    Args:
+        babel_session (Babel): The session-wide Babel instance.
+
+    Returns:
+        Babel: The Babel instance with mock models.
+    """
+    babel_session.whisper_model.reset_mock(return_value=True, side_effect=True)
+    babel_session.classifier.reset_mock(return_value=True, side_effect=True)
+    return babel_session
@@ -1,12 +1,23 @@
-import sys
+import io
 import os
+import time
+import tracemalloc
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
 from unittest.mock import MagicMock, patch
+import av
+import numpy as np
 import pytest
 
-# Add the project root to the path so we can import the module
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-
-from babel.core import Babel
+from babel.core import (
+    Babel,
+    BatchScheduler,
+    as_waveform,
+    compute_logmel,
+    load_segment,
+)
 
 
 def test_get_language_name() -> None:
@@ -18,6 +29,14 @@ def test_get_language_name() -> None:
     assert Babel.get_language_name("xyz") == "Unknown"
 
 
+@pytest.fixture(autouse=True)
+def clear_device_cache() -> None:
+    """
+    Clear the cached device selection so each test sees its own mocks.
+    """
+    Babel.get_device.cache_clear()
+
+
 @patch("torch.cuda.is_available")
 @patch("torch.backends.mps.is_available")
 def test_get_device_cuda(mock_mps: MagicMock, mock_cuda: MagicMock) -> None:
@@ -62,105 +81,923 @@ def test_get_device_cpu(mock_mps: MagicMock, mock_cuda: MagicMock) -> None:
     assert Babel.get_device() == "cpu"
 
 
-def test_save_uploaded_file() -> None:
+@pytest.mark.parametrize("device", ["cuda", "mps", "cpu"])
+@patch("torch.cuda.is_available")
+@patch("torch.backends.mps.is_available")
+def test_get_device_env_override(
+    mock_mps: MagicMock,
+    mock_cuda: MagicMock,
+    device: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that BABEL_DEVICE skips device detection.
+
+    Args:
+        mock_mps (MagicMock): Mock for MPS availability check.
+        mock_cuda (MagicMock): Mock for CUDA availability check.
+        device (str): The device set in the environment.
+        monkeypatch (pytest.MonkeyPatch): Pytest fixture for the environment.
+    """
+    monkeypatch.setenv("BABEL_DEVICE", device)
+    assert Babel.get_device() == device
+    mock_cuda.assert_not_called()
+    mock_mps.assert_not_called()
+
+
+@patch("torch.cuda.is_available", return_value=True)
+def test_get_device_cached(mock_cuda: MagicMock) -> None:
+    """
+    Test that the device is probed only once.
+
+    Args:
+        mock_cuda (MagicMock): Mock for CUDA availability check.
+    """
+    assert Babel.get_device() == "cuda"
+    assert Babel.get_device() == "cuda"
+    mock_cuda.assert_called_once()
+
+
+def test_save_uploaded_file(tmp_path: Path) -> None:
     """
     Test the save_uploaded_file method.
+
+    Args:
+        tmp_path (Path): Pytest temporary directory standing in for the scratch dir.
     """
-    mock_file = MagicMock()
+    source = io.BytesIO(b"fake audio content")
+    source.seek(0, io.SEEK_END)
+    mock_file = MagicMock(wraps=source)
     mock_file.name = "test_audio.mp3"
-    mock_file.getvalue.return_value = b"fake audio content"
 
-    with patch("tempfile.NamedTemporaryFile") as mock_temp:
-        mock_temp_file = MagicMock()
-        mock_temp_file.name = "/tmp/test_audio.mp3"
-        mock_temp.return_value.__enter__.return_value = mock_temp_file
+    # Objects without ``read`` fall back to ``getvalue``
+    buffer_only = MagicMock(spec=["name", "getvalue"])
+    buffer_only.name = "test_audio"
+    buffer_only.getvalue.return_value = b"fake audio content"
+
+    paths = iter([str(tmp_path / "0.mp3"), str(tmp_path / "1.mp3")])
+    with patch(
+        "babel.core._new_scratch_path", side_effect=lambda _: next(paths)
+    ) as mock_scratch_path:
+        saved = Babel.save_uploaded_file(mock_file)
+
+        assert os.fspath(saved) == saved.path == str(tmp_path / "0.mp3")
+        assert Path(saved).read_bytes() == b"fake audio content"
+        mock_file.getvalue.assert_not_called()
+
+        saved.close()
+        assert not Path(saved).exists()
+
+        with Babel.save_uploaded_file(buffer_only) as saved:
+            assert Path(saved).read_bytes() == b"fake audio content"
+        assert not Path(saved).exists()
+        # Files without an extension default to mp3
+        mock_scratch_path.assert_called_with(".mp3")
+
+    # Empty uploads are rejected before anything tries to decode them
+    empty = MagicMock(spec=["name", "getvalue"])
+    empty.name = "empty.mp3"
+    empty.getvalue.return_value = b""
+    with (
+        patch("babel.core._new_scratch_path", return_value=str(tmp_path / "e.mp3")),
+        pytest.raises(ValueError, match="empty"),
+    ):
+        Babel.save_uploaded_file(empty)
+    assert not (tmp_path / "e.mp3").exists()
+
+
+def _write_wav(path: Path, samples: np.ndarray) -> None:
+    """
+    Write 16 kHz int16 PCM to a WAV file.
+
+    Args:
+        path (Path): The output path.
+        samples (np.ndarray): Samples of shape (frames, channels) in [-1, 1].
+    """
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(samples.shape[1])
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes((samples * 32767).astype("<i2").tobytes())
+
+
+def test_slice_audio_saved_upload(tmp_path: Path) -> None:
+    """
+    Test that a saved upload can be decoded directly by slice_audio.
+
+    Args:
+        tmp_path (Path): Pytest temporary directory standing in for the scratch dir.
+    """
+    source = tmp_path / "source.wav"
+    _write_wav(source, np.full((16000 * 2, 1), 0.25))
+    upload = io.BytesIO(source.read_bytes())
+    upload.name = "tone.wav"
+
+    with (
+        patch("babel.core._new_scratch_path", return_value=str(tmp_path / "0.wav")),
+        Babel.save_uploaded_file(upload) as saved,
+    ):
+        audio = Babel.slice_audio(saved, 1.0, 0.5)
+
+    assert audio.shape == (8000,)
+    assert np.allclose(audio, 0.25, atol=1e-3)
+
+
+def test_slice_audio_long_duration(tmp_path: Path) -> None:
+    """
+    Test that a duration beyond the end of the file only allocates what it holds.
+
+    Args:
+        tmp_path (Path): Pytest temporary directory for the WAV file.
+    """
+    source = tmp_path / "short.wav"
+    _write_wav(source, np.full((16000 * 2, 1), 0.25))
+
+    tracemalloc.start()
+    try:
+        audio = Babel.slice_audio(str(source), 0.0, 86400.0)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert audio.shape == (32000,)
+    assert peak < 16 * 1024 * 1024
+
+
+@patch("av.AudioResampler")
+@patch("av.open")
+def test_slice_audio_understated_duration(
+    mock_open: MagicMock, mock_resampler: MagicMock
+) -> None:
+    """
+    Test that the buffer grows when the file is longer than its header says.
+
+    Args:
+        mock_open (MagicMock): Mock for av.open.
+        mock_resampler (MagicMock): Mock for av.AudioResampler.
+    """
+    frame = MagicMock()
+    frame.time = 0.0
+    container = _mock_container([frame] * 5)
+    container.duration = 1_000_000
+    mock_open.return_value = container
+    resampled = MagicMock()
+    resampled.to_ndarray.return_value = np.full((1, 16000), 0.5, dtype=np.float32)
+    # Nothing is left in the resampler when it is flushed
+    mock_resampler.return_value.resample.side_effect = lambda frame: (
+        [resampled] if frame is not None else []
+    )
+
+    audio = Babel.slice_audio("input.mp3", 0.0, 10.0)
+
+    assert audio.shape == (80000,)
+    assert np.allclose(audio, 0.5)
+
+
+def test_slice_audio_honours_start_time(tmp_path: Path) -> None:
+    """
+    Test that start times are relative to the file start, e.g. for MP3 priming.
+
+    Args:
+        tmp_path (Path): Pytest temporary directory for the MP3 file.
+    """
+    source = tmp_path / "noise.mp3"
+    noise = np.random.default_rng(0).uniform(-0.2, 0.2, (1, 16000 * 3))
+    with av.open(str(source), "w") as output:
+        stream = output.add_stream("libmp3lame", rate=16000, layout="mono")
+        frame = av.AudioFrame.from_ndarray(
+            noise.astype(np.float32), format="flt", layout="mono"
+        )
+        frame.sample_rate = 16000
+        for packet in [*stream.encode(frame), *stream.encode(None)]:
+            output.mux(packet)
+    with av.open(str(source)) as container:
+        assert container.start_time
+
+    full = Babel.slice_audio(str(source), 0.0, 3.0)
+    segment = Babel.slice_audio(str(source), 1.0, 0.5)
+
+    # The decoder needs a few frames after the seek to match decoding from 0
+    assert np.allclose(segment[4000:], full[20000:24000], atol=1e-4)
+
+
+@pytest.mark.parametrize(
+    ("left", "right", "expected"), [(0.5, 0.5, 0.5), (0.9, 0.9, 0.9), (0.9, -0.3, 0.3)]
+)
+def test_slice_audio_stereo_downmix(
+    tmp_path: Path, left: float, right: float, expected: float
+) -> None:
+    """
+    Test that stereo audio is downmixed to the mean of its channels.
+
+    Args:
+        tmp_path (Path): Pytest temporary directory for the WAV file.
+        left (float): The left channel level.
+        right (float): The right channel level.
+        expected (float): The expected mono level.
+    """
+    source = tmp_path / "stereo.wav"
+    _write_wav(source, np.tile([left, right], (16000, 1)))
 
-        path = Babel.save_uploaded_file(mock_file)
+    audio = Babel.slice_audio(str(source), 0.0, 0.5)
 
-        assert path == "/tmp/test_audio.mp3"
-        mock_temp_file.write.assert_called_once_with(b"fake audio content")
+    assert np.allclose(audio, expected, atol=1e-3)
 
 
-@patch("subprocess.run")
-@patch("pathlib.Path.stat")
-def test_slice_audio(mock_stat: MagicMock, mock_run: MagicMock) -> None:
+def test_parse_time() -> None:
+    """
+    Test the parse_time method.
+    """
+    assert Babel.parse_time(12.5) == 12.5
+    assert Babel.parse_time("90") == 90.0
+    assert Babel.parse_time("01:30") == 90.0
+    assert Babel.parse_time("01:00:05") == 3605.0
+
+
+def _mock_container(frames: list[MagicMock]) -> MagicMock:
+    """
+    Build a mock PyAV container yielding the given audio frames.
+
+    Args:
+        frames (list[MagicMock]): The frames returned by ``decode``.
+
+    Returns:
+        MagicMock: The mock container.
+    """
+    container = MagicMock()
+    container.__enter__.return_value = container
+    container.decode.return_value = iter(frames)
+    container.duration = None
+    container.start_time = None
+    return container
+
+
+@patch("av.AudioResampler")
+@patch("av.open")
+def test_slice_audio(mock_open: MagicMock, mock_resampler: MagicMock) -> None:
     """
     Test the slice_audio method.
 
     Args:
-        mock_stat (MagicMock): Mock for file stat.
-        mock_run (MagicMock): Mock for subprocess.run.
+        mock_open (MagicMock): Mock for av.open.
+        mock_resampler (MagicMock): Mock for av.AudioResampler.
+    """
+    frame = MagicMock()
+    frame.time = 10.0
+    container = _mock_container([frame] * 10)
+    mock_open.return_value = container
+
+    # Each resampled frame carries one second of half-scale 16 kHz audio
+    resampled = MagicMock()
+    resampled.to_ndarray.return_value = np.full((1, 16000), 0.5, dtype=np.float32)
+    mock_resampler.return_value.resample.return_value = [resampled]
+
+    audio = Babel.slice_audio("input.mp3", 10.0, 5.0)
+
+    mock_open.assert_called_once_with("input.mp3")
+    container.seek.assert_called_once_with(10_000_000)
+    assert audio.dtype == np.float32
+    assert audio.shape == (80000,)
+    assert np.allclose(audio, 0.5)
+
+
+@patch("av.AudioResampler")
+@patch("av.open")
+def test_slice_audio_many(mock_open: MagicMock, mock_resampler: MagicMock) -> None:
+    """
+    Test that slice_audio_many decodes all segments from one open container.
+
+    Args:
+        mock_open (MagicMock): Mock for av.open.
+        mock_resampler (MagicMock): Mock for av.AudioResampler.
     """
-    # Mock file size check
-    mock_stat_obj = MagicMock()
-    mock_stat_obj.st_size = 1024  # Non-zero size
-    mock_stat.return_value = mock_stat_obj
+    frame = MagicMock()
+    frame.time = 0.0
+    container = _mock_container([])
+    container.decode.side_effect = lambda **_: iter([frame] * 10)
+    mock_open.return_value = container
 
-    with patch("tempfile.NamedTemporaryFile") as mock_temp:
-        mock_temp_file = MagicMock()
-        mock_temp_file.name = "/tmp/sliced.wav"
-        mock_temp.return_value.__enter__.return_value = mock_temp_file
+    resampled = MagicMock()
+    resampled.to_ndarray.return_value = np.full((1, 16000), 0.5, dtype=np.float32)
+    mock_resampler.return_value.resample.return_value = [resampled]
 
-        output_path = Babel.slice_audio("input.mp3", 10.0, 5.0)
+    audios = Babel.slice_audio_many("input.mp3", [(0.0, 2.0), (0.0, 1.0)])
 
-        assert output_path == "/tmp/sliced.wav"
-        mock_run.assert_called_once()
-        args, _ = mock_run.call_args
-        command = args[0]
-        assert command[0] == "ffmpeg"
-        assert "-ss" in command
-        assert "10.0" in command
-        assert "-t" in command
-        assert "5.0" in command
+    mock_open.assert_called_once_with("input.mp3")
+    container.seek.assert_called_once_with(0)
+    assert [audio.shape for audio in audios] == [(32000,), (16000,)]
 
 
-@patch("subprocess.run")
-@patch("pathlib.Path.stat")
-def test_slice_audio_empty_output(mock_stat: MagicMock, mock_run: MagicMock) -> None:
+def test_slice_audio_parallel() -> None:
+    """
+    Test that slice_audio_parallel splits segments into ordered runs per worker.
+    """
+    segments = [(float(start), 1.0) for start in range(5)]
+
+    def fake_slice(
+        source: io.BytesIO, run: list[tuple[float, float]], thread_count: int
+    ) -> list[np.ndarray]:
+        assert isinstance(source, io.BytesIO)
+        assert thread_count == 3
+        return [np.full(1, start, dtype=np.float32) for start, _ in run]
+
+    with patch(
+        "babel.core.Babel.slice_audio_many", side_effect=fake_slice
+    ) as mock_slice:
+        audios = Babel.slice_audio_parallel(
+            b"media", segments, max_workers=2, threads_per_worker=3
+        )
+
+    assert [audio[0] for audio in audios] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert mock_slice.call_count == 2
+    assert Babel.slice_audio_parallel(b"media", []) == []
+
+
+@patch("av.AudioResampler")
+@patch("av.open")
+def test_slice_audio_empty_output(
+    mock_open: MagicMock, mock_resampler: MagicMock
+) -> None:
     """
     Test the slice_audio method for empty output.
 
     Args:
-        mock_stat (MagicMock): Mock for file stat.
-        mock_run (MagicMock): Mock for subprocess.run.
+        mock_open (MagicMock): Mock for av.open.
+        mock_resampler (MagicMock): Mock for av.AudioResampler.
     """
-    # Mock file size check to return 0
-    mock_stat_obj = MagicMock()
-    mock_stat_obj.st_size = 0
-    mock_stat.return_value = mock_stat_obj
+    mock_open.return_value = _mock_container([])
+    mock_resampler.return_value.resample.return_value = []
 
-    with patch("tempfile.NamedTemporaryFile") as mock_temp:
-        mock_temp_file = MagicMock()
-        mock_temp_file.name = "/tmp/sliced.wav"
-        mock_temp.return_value.__enter__.return_value = mock_temp_file
+    with pytest.raises(ValueError):
+        Babel.slice_audio("input.mp3", 0, 5)
 
-        with pytest.raises(ValueError):
-            Babel.slice_audio("input.mp3", 0, 5)
 
+@patch("av.AudioResampler")
+@patch("av.open")
+def test_slice_audio_probe_fallback(
+    mock_open: MagicMock, mock_resampler: MagicMock
+) -> None:
+    """
+    Test that a file failing to open with its extension's format is probed.
 
-def test_predict_dialect():
+    Args:
+        mock_open (MagicMock): Mock for av.open.
+        mock_resampler (MagicMock): Mock for av.AudioResampler.
     """
-    Test the predict_dialect method.
+    import av
+
+    frame = MagicMock()
+    frame.time = 0.0
+    container = _mock_container([frame])
+    mock_open.side_effect = [av.error.FFmpegError(1, "Invalid data"), container]
+
+    resampled = MagicMock()
+    resampled.to_ndarray.return_value = np.full((1, 16000), 0.5, dtype=np.float32)
+    mock_resampler.return_value.resample.return_value = [resampled]
+
+    source = io.BytesIO(b"mislabeled")
+    source.name = "upload.wav"
+    audio = Babel.slice_audio(source, 0.0, 1.0)
+
+    assert mock_open.call_count == 2
+    assert mock_open.call_args_list[0].kwargs == {
+        "format": "wav",
+        "options": {"probesize": "32", "analyzeduration": "0"},
+    }
+    assert mock_open.call_args_list[1].args == (source,)
+    assert mock_open.call_args_list[1].kwargs == {}
+    assert audio.shape == (16000,)
+
+
+@patch("av.open")
+def test_slice_audio_start_past_end(mock_open: MagicMock) -> None:
+    """
+    Test that a start time past the end fails before seeking or decoding.
+
+    Args:
+        mock_open (MagicMock): Mock for av.open.
+    """
+    container = _mock_container([])
+    container.duration = 20_000_000  # 20 seconds in av.time_base units
+    mock_open.return_value = container
+
+    with pytest.raises(ValueError, match="past the end"):
+        Babel.slice_audio("input.mp3", "00:00:30", 5.0)
+    container.seek.assert_not_called()
+    container.decode.assert_not_called()
+
+
+@patch("av.open")
+def test_slice_audio_no_audio_stream(mock_open: MagicMock) -> None:
+    """
+    Test that slice_audio rejects files without an audio stream.
+
+    Args:
+        mock_open (MagicMock): Mock for av.open.
+    """
+    container = _mock_container([])
+    container.streams.audio = []
+    mock_open.return_value = container
+
+    with pytest.raises(ValueError, match="no audio stream"):
+        Babel.slice_audio("video.mp4", 0.0, 5.0)
+    container.decode.assert_not_called()
+
+
+def test_slice_audio_invalid_file() -> None:
+    """
+    Test that FFmpeg errors are reported as ValueError.
+    """
+    with pytest.raises(ValueError, match="Failed to open media file"):
+        Babel.slice_audio(io.BytesIO(b"not a media file" * 64), 0.0, 5.0)
+
+
+@patch("torch.autocast")
+@patch("torch.compile")
+def test_compile_encoder(mock_compile: MagicMock, mock_autocast: MagicMock) -> None:
+    """
+    Test that compile_encoder compiles and warms up the Whisper encoder.
+
+    Args:
+        mock_compile (MagicMock): Mock for torch.compile.
+        mock_autocast (MagicMock): Mock for torch.autocast.
+    """
+    model = MagicMock()
+    model.dims.n_mels = 80
+    model.device = "cpu"
+    encoder = model.encoder
+
+    Babel.compile_encoder(model)
+
+    mock_compile.assert_called_once_with(
+        encoder, mode="reduce-overhead", fullgraph=True
+    )
+    assert model.encoder is mock_compile.return_value
+    (dummy,), _ = mock_compile.return_value.call_args
+    assert dummy.shape == (1, 80, 3000)
+
+
+@patch("torch.autocast")
+@patch("torch.compile")
+def test_compile_encoder_falls_back(
+    mock_compile: MagicMock, mock_autocast: MagicMock
+) -> None:
+    """
+    Test that compile_encoder keeps the eager encoder if compilation fails.
+
+    Args:
+        mock_compile (MagicMock): Mock for torch.compile.
+        mock_autocast (MagicMock): Mock for torch.autocast.
+    """
+    model = MagicMock()
+    model.dims.n_mels = 80
+    model.device = "cpu"
+    encoder = model.encoder
+    mock_compile.return_value.side_effect = RuntimeError("compile failed")
+
+    Babel.compile_encoder(model)
+
+    assert model.encoder is encoder
+
+
+@patch("torch.compile")
+def test_compile_classifier_falls_back(mock_compile: MagicMock) -> None:
+    """
+    Test that compile_classifier keeps the eager model if compilation fails.
+
+    Args:
+        mock_compile (MagicMock): Mock for torch.compile.
+    """
+    classifier = MagicMock()
+    model = classifier.model
+    classifier.side_effect = RuntimeError("compile failed")
+
+    Babel.compile_classifier(classifier)
+
+    mock_compile.assert_called_once_with(model, dynamic=True)
+    assert classifier.model is model
+
+
+@patch("torch.ao.quantization.quantize_dynamic")
+@patch("transformers.pipelines.pipeline")
+def test_load_classifier_int8_cpu(
+    mock_pipeline: MagicMock, mock_quantize: MagicMock
+) -> None:
+    """
+    Test that the classifier is dynamically quantized on CPU.
+
+    Args:
+        mock_pipeline (MagicMock): Mock for the transformers pipeline factory.
+        mock_quantize (MagicMock): Mock for torch dynamic quantization.
+    """
+    classifier = Babel.load_classifier("int8-model", "cpu", "int8")
+
+    mock_pipeline.assert_called_once_with(
+        task="audio-classification", model="int8-model", device="cpu"
+    )
+    mock_quantize.assert_called_once()
+    assert classifier.model is mock_quantize.return_value
+
+
+@patch("babel.core.Babel.compile_classifier")
+@patch("transformers.pipelines.pipeline")
+def test_load_classifier_fp16_cuda(
+    mock_pipeline: MagicMock, mock_compile_classifier: MagicMock
+) -> None:
+    """
+    Test that fp16 precision loads half precision weights on CUDA.
+
+    Args:
+        mock_pipeline (MagicMock): Mock for the transformers pipeline factory.
+        mock_compile_classifier (MagicMock): Mock for Babel.compile_classifier.
+    """
+    import torch
+
+    classifier = Babel.load_classifier("fp16-model", "cuda", "fp16")
+
+    mock_pipeline.assert_called_once_with(
+        task="audio-classification",
+        model="fp16-model",
+        device="cuda",
+        dtype=torch.float16,
+    )
+    assert classifier is mock_pipeline.return_value
+    mock_compile_classifier.assert_called_once_with(classifier)
+
+
+@patch("babel.core.Babel.compile_classifier")
+@patch("transformers.pipelines.pipeline")
+@patch("importlib.util.find_spec")
+def test_load_classifier_int8_cuda_without_accelerate(
+    mock_find_spec: MagicMock,
+    mock_pipeline: MagicMock,
+    mock_compile_classifier: MagicMock,
+) -> None:
+    """
+    Test that int8 on CUDA falls back to fp32 when accelerate is missing.
+
+    Args:
+        mock_find_spec (MagicMock): Mock for importlib.util.find_spec.
+        mock_pipeline (MagicMock): Mock for the transformers pipeline factory.
+        mock_compile_classifier (MagicMock): Mock for Babel.compile_classifier.
+    """
+    mock_find_spec.side_effect = lambda name: None if name == "accelerate" else object()
+
+    classifier = Babel.load_classifier("int8-model", "cuda", "int8")
+
+    mock_pipeline.assert_called_once_with(
+        task="audio-classification", model="int8-model", device="cuda"
+    )
+    assert classifier is mock_pipeline.return_value
+    mock_compile_classifier.assert_called_once_with(classifier)
+
+
+def test_load_classifier_invalid_precision() -> None:
+    """
+    Test that an unknown precision is rejected.
+    """
+    with pytest.raises(ValueError):
+        Babel.load_classifier("model", "cpu", "int4")
+
+
+def test_as_waveform() -> None:
+    """
+    Test that as_waveform passes float32 audio through and converts PCM.
+    """
+    audio = np.zeros(160, dtype=np.float32)
+    assert as_waveform(audio) is audio
+
+    pcm = np.array([-32768, 0, 16384], dtype=np.int16)
+    converted = as_waveform(pcm)
+    assert converted.dtype == np.float32
+    assert np.array_equal(converted, [-1.0, 0.0, 0.5])
+
+    with pytest.raises(ValueError):
+        as_waveform(np.zeros((2, 160), dtype=np.float32))
+    with pytest.raises(ValueError):
+        as_waveform(np.zeros(0, dtype=np.float32))
+    with pytest.raises(ValueError, match="Unsigned"):
+        as_waveform(np.full(160, 128, dtype=np.uint8))
+
+
+@pytest.mark.parametrize("n_mels", [80, 128])
+def test_compute_logmel(n_mels: int) -> None:
+    """
+    Test that compute_logmel returns a fixed-size 30 second spectrogram.
+
+    Args:
+        n_mels (int): The number of mel bins.
+    """
+    audio = np.random.default_rng(0).standard_normal(16000 * 5).astype(np.float32)
+
+    mel = compute_logmel(audio, n_mels)
+
+    assert mel.shape == (n_mels, 3000)
+    assert mel.dtype == np.float32
+
+
+@patch("babel.core.get_preprocess_executor")
+@patch("babel.core.Babel.slice_audio")
+def test_load_segment(mock_slice: MagicMock, mock_executor: MagicMock) -> None:
+    """
+    Test that load_segment preprocesses in the pool and caches the result.
+
+    Args:
+        mock_slice (MagicMock): Mock for the slice_audio method.
+        mock_executor (MagicMock): Mock for the preprocessing pool factory.
+    """
+    mock_slice.return_value = np.zeros(16000, dtype=np.float32)
+    mock_executor.return_value = ThreadPoolExecutor(max_workers=1)
+    load_segment.clear()
+
+    audio, mel = load_segment("/tmp/upload.mp3", "0", 1.0, 80)
+    load_segment("/tmp/upload.mp3", "0", 1.0, 80)
+
+    # Only the path is handed to the worker, which reads the file itself
+    mock_slice.assert_called_once_with("/tmp/upload.mp3", "0", 1.0)
+    assert audio.shape == (16000,)
+    assert mel.shape == (80, 3000)
+
+
+@patch("babel.core.get_preprocess_executor")
+@patch("babel.core.Babel.slice_audio")
+def test_load_segment_restarts_broken_pool(
+    mock_slice: MagicMock, mock_executor: MagicMock
+) -> None:
+    """
+    Test that load_segment replaces a broken pool and retries once.
+
+    Args:
+        mock_slice (MagicMock): Mock for the slice_audio method.
+        mock_executor (MagicMock): Mock for the preprocessing pool factory.
+    """
+    mock_slice.return_value = np.zeros(16000, dtype=np.float32)
+    broken = MagicMock()
+    broken.submit.side_effect = BrokenProcessPool("A worker died")
+    healthy = ThreadPoolExecutor(max_workers=1)
+    mock_executor.return_value = broken
+    mock_executor.clear.side_effect = lambda: setattr(
+        mock_executor, "return_value", healthy
+    )
+    load_segment.clear()
+
+    audio, _ = load_segment("/tmp/upload.mp3", "0", 1.0, 80)
+
+    mock_executor.clear.assert_called_once()
+    broken.shutdown.assert_called_once_with(wait=False)
+    assert audio.shape == (16000,)
+
+
+def test_babel_loads_models_lazily() -> None:
+    """
+    Test that models load on first use or through warm_up, not in the constructor.
     """
-    # Mock the Babel instance and its classifier
     with (
-        patch("babel.core.Babel.load_whisper_model"),
+        patch.dict(os.environ, {"LID_MODEL": "tiny", "WHISPER_MODEL": "turbo"}),
+        patch("babel.core.Babel.load_whisper_model") as mock_load_whisper,
         patch("babel.core.Babel.load_classifier") as mock_load_classifier,
         patch("babel.core.Babel.get_device"),
     ):
-        mock_classifier = MagicMock()
-        mock_load_classifier.return_value = mock_classifier
+        babel = Babel()
+        mock_load_whisper.assert_not_called()
+        mock_load_classifier.assert_not_called()
+
+        babel.warm_up()
+        assert {call.args[0] for call in mock_load_whisper.call_args_list} == {
+            "turbo",
+            "tiny",
+        }
+        mock_load_classifier.assert_called_once()
+        assert babel.classifier is mock_load_classifier.return_value
+
+
+def test_babel_loads_each_model_once_across_threads() -> None:
+    """
+    Test that concurrent first accesses share a single model load.
+    """
+
+    def slow_load(*args: object) -> MagicMock:
+        time.sleep(0.05)
+        return MagicMock()
+
+    with (
+        patch("babel.core.Babel.load_classifier", side_effect=slow_load) as mock_load,
+        patch("babel.core.Babel.get_device"),
+    ):
+        babel = Babel(device="cpu")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            classifiers = list(executor.map(lambda _: babel.classifier, range(4)))
+
+    mock_load.assert_called_once()
+    assert all(classifier is classifiers[0] for classifier in classifiers)
+
+
+@patch("babel.core.Babel.get_device")
+def test_babel_device_argument(mock_get_device: MagicMock) -> None:
+    """
+    Test that an explicit device skips detection.
+
+    Args:
+        mock_get_device (MagicMock): Mock for Babel.get_device.
+    """
+    assert Babel(device="cpu").device == "cpu"
+    mock_get_device.assert_not_called()
+
+
+def test_detect_language_faster_whisper() -> None:
+    """
+    Test the detect_language method with the faster-whisper backend.
+    """
+    with (
+        patch.dict(os.environ, {"LID_MODEL": ""}),
+        patch("babel.core.Babel.load_whisper_model") as mock_load_whisper,
+        patch("babel.core.Babel.load_classifier"),
+        patch("babel.core.Babel.get_device"),
+    ):
+        mock_model = MagicMock()
+        mock_model.feature_extractor.mel_filters = np.zeros((128, 201))
+        mock_model.model.detect_language.return_value = [
+            [("<|ar|>", 0.9), ("<|en|>", 0.1)]
+        ]
+        mock_load_whisper.return_value = mock_model
+
+        babel = Babel()
+        babel.whisper_backend = "faster-whisper"
+
+        assert babel.detect_language(np.zeros(16000, dtype=np.float32)) == "ar"
+        (features,), _ = mock_model.encode.call_args
+        assert features.shape == (1, 128, 3000)
+        mock_model.model.detect_language.assert_called_once_with(
+            mock_model.encode.return_value
+        )
+
+
+def test_detect_language_openai() -> None:
+    """
+    Test the detect_language method with the openai-whisper backend.
+    """
+    import torch
+    from whisper.tokenizer import get_tokenizer
+
+    tokenizer = get_tokenizer(True, num_languages=99)
+    with (
+        patch.dict(os.environ, {"LID_MODEL": "", "WHISPER_BACKEND": "openai"}),
+        patch("babel.core.Babel.load_whisper_model") as mock_load_whisper,
+        patch("babel.core.Babel.load_classifier"),
+        patch("babel.core.Babel.get_device", return_value="cpu"),
+    ):
+        mock_model = MagicMock()
+        mock_model.is_multilingual = True
+        mock_model.num_languages = 99
+        mock_model.device = torch.device("cpu")
+        mock_model.dims.n_mels = 80
+        logits = torch.zeros(1, 1, tokenizer.encoding.n_vocab)
+        logits[0, 0, tokenizer.to_language_token("ar")] = 10.0
+        # A non-language token must not win even with a higher logit
+        logits[0, 0, tokenizer.eot] = 100.0
+        mock_model.logits.return_value = logits
+        mock_load_whisper.return_value = mock_model
+
+        babel = Babel()
+
+        assert babel.detect_language(np.zeros(16000, dtype=np.float32)) == "ar"
+        (tokens, _), _ = mock_model.logits.call_args
+        assert tokens.tolist() == [[tokenizer.sot]]
+
+
+def test_detect_language_lid_fast_path() -> None:
+    """
+    Test that the language ID model short-circuits confident Arabic detections.
+    """
+    with (
+        patch.dict(os.environ, {"LID_MODEL": "tiny", "WHISPER_MODEL": "turbo"}),
+        patch("babel.core.Babel.load_whisper_model") as mock_load_whisper,
+        patch("babel.core.Babel.load_classifier"),
+        patch("babel.core.Babel.get_device"),
+    ):
+        main_model, lid_model = MagicMock(), MagicMock()
+        main_model.feature_extractor.mel_filters = np.zeros((128, 201))
+        lid_model.feature_extractor.mel_filters = np.zeros((80, 201))
+        main_model.model.detect_language.return_value = [[("<|en|>", 0.9)]]
+        # The models load in parallel, so pick the mock by model ID
+        mock_load_whisper.side_effect = lambda model_id, *_: {
+            "turbo": main_model,
+            "tiny": lid_model,
+        }[model_id]
 
         babel = Babel()
+        babel.whisper_backend = "faster-whisper"
+        audio = np.zeros(16000 * 10, dtype=np.float32)
+
+        # Confident Arabic: the main model is never consulted
+        lid_model.model.detect_language.return_value = [[("<|ar|>", 0.95)]]
+        assert babel.detect_language(audio) == "ar"
+        (features,), _ = lid_model.encode.call_args
+        assert features.shape == (1, 80, 3000)
+        main_model.encode.assert_not_called()
+
+        # Unsure: fall back to the main model
+        lid_model.model.detect_language.return_value = [[("<|ar|>", 0.6)]]
+        assert babel.detect_language(audio) == "en"
+        main_model.encode.assert_called_once()
+
+
+def test_predict_dialect(babel_stub: Babel) -> None:
+    """
+    Test the predict_dialect method.
+
+    Args:
+        babel_stub (Babel): Babel instance with mock models.
+    """
+    mock_classifier = babel_stub.classifier
+    audio = np.zeros(16000, dtype=np.float32)
+
+    # Case 1: List of dicts
+    mock_classifier.return_value = [[{"label": "EGY", "score": 0.9}]]
+    result = babel_stub.predict_dialect(audio)
+    assert len(result) == 1
+    assert result[0]["label"] == "EGY"
+    # Lists from the pipeline are passed through without a copy
+    assert result is mock_classifier.return_value[0]
+    (inputs,), kwargs = mock_classifier.call_args
+    assert inputs[0]["array"] is audio
+    assert inputs[0]["sampling_rate"] == 16000
+    assert kwargs["batch_size"] == 1
+
+    # Case 2: Single dict (not in list, though pipeline usually returns list)
+    mock_classifier.return_value = [{"label": "LEV", "score": 0.8}]
+    result = babel_stub.predict_dialect(audio)
+    assert len(result) == 1
+    assert result[0]["label"] == "LEV"
+    assert isinstance(result, tuple)
+
+
+def test_predict_dialect_long_audio_unbatched(babel_stub: Babel) -> None:
+    """
+    Test that audio past the last length bucket is never batched with others.
+
+    Args:
+        babel_stub (Babel): Babel instance with mock models.
+    """
+    mock_classifier = babel_stub.classifier
+    mock_classifier.side_effect = lambda inputs, **kwargs: [
+        [{"label": "EGY", "score": 0.9}] for _ in inputs
+    ]
+    audios = [np.zeros(16000 * 40, dtype=np.float32) for _ in range(3)]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(babel_stub.predict_dialect, audios))
+
+    assert all(result[0]["label"] == "EGY" for result in results)
+    assert mock_classifier.call_count == 3
+    for (inputs,), kwargs in mock_classifier.call_args_list:
+        assert len(inputs) == kwargs["batch_size"] == 1
+
+
+def test_predict_dialects(babel_stub: Babel) -> None:
+    """
+    Test that predict_dialects classifies several segments in one call.
+
+    Args:
+        babel_stub (Babel): Babel instance with mock models.
+    """
+    mock_classifier = babel_stub.classifier
+    mock_classifier.return_value = [
+        [{"label": "EGY", "score": 0.9}],
+        [{"label": "LEV", "score": 0.7}],
+        {"label": "GLF", "score": 0.6},
+    ]
+
+    audios = [np.zeros(16000 * n, dtype=np.float32) for n in (1, 2, 3)]
+    results = babel_stub.predict_dialects(audios, batch_size=2)
+
+    assert [result[0]["label"] for result in results] == ["EGY", "LEV", "GLF"]
+    assert mock_classifier.call_count == 1
+    (inputs,), kwargs = mock_classifier.call_args
+    assert [item["array"].size for item in inputs] == [16000, 32000, 48000]
+    assert kwargs["batch_size"] == 2
+    assert babel_stub.predict_dialects([]) == []
+
+
+def test_batch_scheduler_coalesces_requests() -> None:
+    """
+    Test that the BatchScheduler runs concurrent submissions as one batch.
+    """
+    batch_fn = MagicMock(side_effect=lambda items: [item * 2 for item in items])
+    scheduler = BatchScheduler(batch_fn, name="test", max_batch=3, max_wait=1.0)
+
+    futures = [scheduler.submit(i) for i in range(3)]
+
+    assert [future.result(timeout=5) for future in futures] == [0, 2, 4]
+    batch_fn.assert_called_once_with([0, 1, 2])
+
+
+def test_batch_scheduler_propagates_errors() -> None:
+    """
+    Test that a failing batch resolves every waiting future with the error.
+    """
+    batch_fn = MagicMock(side_effect=RuntimeError("boom"))
+    scheduler = BatchScheduler(batch_fn, name="test", max_wait=0.0)
 
-        # Case 1: List of dicts
-        mock_classifier.return_value = [{"label": "EGY", "score": 0.9}]
-        result = babel.predict_dialect("file.wav")
-        assert len(result) == 1
-        assert result[0]["label"] == "EGY"
-
-        # Case 2: Single dict (not in list, though pipeline usually returns list)
-        mock_classifier.return_value = {"label": "LEV", "score": 0.8}
-        result = babel.predict_dialect("file.wav")
-        assert len(result) == 1
-        assert result[0]["label"] == "LEV"
+    with pytest.raises(RuntimeError, match="boom"):
+        scheduler.submit(1).result(timeout=5)